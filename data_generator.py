@@ -1,9 +1,19 @@
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Single seeded generator shared by every draw, for reproducibility
+rng = np.random.default_rng(42)
+
+
+def sample_codes(p, n):
+    """Draw n integer codes from the discrete distribution p."""
+    cdf = np.cumsum(p)
+    cdf[-1] = 1.0  # guard against round-off in the cumulative sum
+    return np.searchsorted(cdf, rng.random(n), side='right')
 
-# Set random seed for reproducibility
-np.random.seed(42)
 
 # Number of rows
 n_rows = 300
@@ -15,18 +25,19 @@ n_rows = 300
 # numeric, missing values, outliers, skewed features, etc.
 
 # 1. ID and Basic Info
-property_ids = [f"PROP_{i:04d}" for i in range(1, n_rows + 1)]
+property_ids = np.char.add('PROP_', np.char.zfill(np.arange(1, n_rows + 1).astype(str), 4)).astype(object)
 
 # 2. Time-based features (listing dates, sale dates)
-start_date = datetime(2020, 1, 1)
-listing_dates = [start_date + timedelta(days=int(np.random.randint(0, 1460))) for _ in range(n_rows)]
-days_to_sale = np.random.randint(5, 180, n_rows).astype(int)
-sale_dates = [listing_dates[i] + timedelta(days=int(days_to_sale[i])) for i in range(n_rows)]
+start_date = np.datetime64('2020-01-01')
+listing_dates = start_date + rng.integers(0, 1460, n_rows).astype('timedelta64[D]')
+days_to_sale = rng.integers(5, 180, n_rows)
+sale_dates = listing_dates + days_to_sale.astype('timedelta64[D]')
 
 # 3. Geographic features (US cities)
 cities = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 
           'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'Austin']
-city = np.random.choice(cities, n_rows)
+city_idx = rng.integers(0, len(cities), n_rows)
+city = pd.Categorical.from_codes(city_idx, cities)
 
 # Realistic lat/long for each city
 city_coords = {
@@ -42,45 +53,55 @@ city_coords = {
     'Austin': (30.2672, -97.7431)
 }
 
-latitudes = []
-longitudes = []
-for c in city:
-    base_lat, base_lon = city_coords[c]
-    # Add some random variance
-    latitudes.append(base_lat + np.random.normal(0, 0.1))
-    longitudes.append(base_lon + np.random.normal(0, 0.1))
+coord_table = np.array([city_coords[c] for c in cities])
+# Add some random variance
+coords = coord_table[city_idx] + rng.normal(0, 0.1, size=(n_rows, 2))
+latitudes = np.ascontiguousarray(coords[:, 0])
+longitudes = np.ascontiguousarray(coords[:, 1])
 
 # 4. Property features
 property_types = ['Single Family', 'Condo', 'Townhouse', 'Multi Family', 'Villa']
-property_type = np.random.choice(property_types, n_rows, p=[0.4, 0.25, 0.15, 0.1, 0.1])
+pt_idx = sample_codes([0.4, 0.25, 0.15, 0.1, 0.1], n_rows)
+property_type = pd.Categorical.from_codes(pt_idx, property_types)
+sf_code = property_types.index('Single Family')
+condo_code = property_types.index('Condo')
 
-bedrooms = np.random.choice([1, 2, 3, 4, 5, 6], n_rows, p=[0.1, 0.2, 0.35, 0.25, 0.08, 0.02])
-bathrooms = np.random.choice([1, 1.5, 2, 2.5, 3, 3.5, 4], n_rows, p=[0.15, 0.15, 0.3, 0.2, 0.12, 0.05, 0.03])
+bedrooms = np.array([1, 2, 3, 4, 5, 6])[sample_codes([0.1, 0.2, 0.35, 0.25, 0.08, 0.02], n_rows)]
+bathrooms = np.array([1, 1.5, 2, 2.5, 3, 3.5, 4])[sample_codes([0.15, 0.15, 0.3, 0.2, 0.12, 0.05, 0.03], n_rows)]
 
 # Area in square feet (skewed distribution)
-area = np.random.gamma(shape=2, scale=500, size=n_rows) + 500
+area = rng.gamma(shape=2, scale=500, size=n_rows) + 500
 area = np.clip(area, 500, 5000)
 
 # Lot size in acres (skewed, with some missing)
-lot_size = np.random.gamma(shape=1.5, scale=0.3, size=n_rows)
+lot_size = rng.gamma(shape=1.5, scale=0.3, size=n_rows)
 lot_size = np.clip(lot_size, 0.05, 3)
 
 # Age of property (years)
-age = np.random.gamma(shape=3, scale=10, size=n_rows)
+age = rng.gamma(shape=3, scale=10, size=n_rows)
 age = np.clip(age, 0, 100)
 
 # 5. Price (target variable - depends on multiple features)
-base_price = (
-    50000 +  # Base
-    area * 150 +  # Price per sqft
-    bedrooms * 30000 +  # Bedroom premium
-    bathrooms * 20000 +  # Bathroom premium
-    lot_size * 50000 +  # Lot size premium
-    np.where(property_type == 'Single Family', 50000, 0) +
-    np.where(property_type == 'Villa', 100000, 0) +
-    np.random.normal(0, 50000, n_rows) -  # Random variation
-    age * 1000  # Depreciation
-)
+type_premiums = {'Single Family': 50000, 'Villa': 100000}
+type_premium_table = np.array([type_premiums.get(t, 0) for t in property_types], dtype=np.float64)
+
+# Accumulate every term into one buffer (via a single scratch array) instead
+# of letting each `*`/`+` allocate a full-size temporary
+price_weights = [
+    (area, 150),  # Price per sqft
+    (bedrooms, 30000),  # Bedroom premium
+    (bathrooms, 20000),  # Bathroom premium
+    (lot_size, 50000),  # Lot size premium
+    (age, -1000),  # Depreciation
+]
+base_price = np.full(n_rows, 50000.0)  # Base
+scratch = np.empty(n_rows)
+for values, weight in price_weights:
+    base_price += np.multiply(values, weight, out=scratch)
+base_price += type_premium_table[pt_idx]  # Property type premium
+rng.standard_normal(out=scratch)
+scratch *= 50000
+base_price += scratch  # Random variation
 
 # Add city premiums
 city_premiums = {
@@ -90,22 +111,22 @@ city_premiums = {
     'Dallas': 45000, 'Austin': 80000
 }
 
-price = []
-for i in range(n_rows):
-    p = base_price[i] + city_premiums.get(city[i], 0)
-    price.append(max(p, 100000))  # Minimum price
-
-price = np.array(price)
+premium_table = np.array([city_premiums.get(c, 0) for c in cities], dtype=np.float64)
+price = np.maximum(base_price + premium_table[city_idx], 100000.0)  # Minimum price
 
 # Add some outliers (luxury properties)
-outlier_indices = np.random.choice(n_rows, size=15, replace=False)
-price[outlier_indices] = price[outlier_indices] * np.random.uniform(2, 5, 15)
+outlier_indices = rng.choice(n_rows, size=15, replace=False)
+price[outlier_indices] = price[outlier_indices] * rng.uniform(2, 5, 15)
 
 # 6. Categorical features
-condition = np.random.choice(['Excellent', 'Good', 'Fair', 'Poor'], n_rows, p=[0.2, 0.5, 0.25, 0.05])
-parking = np.random.choice(['Garage', 'Carport', 'Street', 'None'], n_rows, p=[0.5, 0.2, 0.2, 0.1])
-has_pool = np.random.choice(['True', 'False'], n_rows, p=[0.3, 0.7])
-has_fireplace = np.random.choice(['Yes', 'No'], n_rows, p=[0.4, 0.6])
+conditions = ['Excellent', 'Good', 'Fair', 'Poor']
+parking_options = ['Garage', 'Carport', 'Street', 'None']
+pool_options = ['True', 'False']
+fireplace_options = ['Yes', 'No']
+condition = pd.Categorical.from_codes(sample_codes([0.2, 0.5, 0.25, 0.05], n_rows), conditions)
+parking = pd.Categorical.from_codes(sample_codes([0.5, 0.2, 0.2, 0.1], n_rows), parking_options)
+has_pool = pd.Categorical.from_codes(sample_codes([0.3, 0.7], n_rows), pool_options)
+has_fireplace = pd.Categorical.from_codes(sample_codes([0.4, 0.6], n_rows), fireplace_options)
 
 # 7. Text features (property descriptions)
 description_templates = [
@@ -116,69 +137,111 @@ description_templates = [
     "Spacious {bedrooms} bedroom {property_type}. Perfect for families! {city} location.",
 ]
 
-descriptions = []
-for i in range(n_rows):
-    template = np.random.choice(description_templates)
-    desc = template.format(
-        condition=condition[i].lower(),
-        property_type=property_type[i].lower(),
-        bedrooms=bedrooms[i],
-        bathrooms=bathrooms[i],
-        city=city[i]
-    )
-    # Add some variation
-    if np.random.random() > 0.7:
-        desc += " Updated kitchen and appliances."
-    if np.random.random() > 0.8:
-        desc += " Close to schools and shopping."
-    descriptions.append(desc)
+template_idx = rng.integers(0, len(description_templates), n_rows)
+updated_mask = rng.random(n_rows) > 0.7
+schools_mask = rng.random(n_rows) > 0.8
+
+# Lowercase each category label once and gather by code
+condition_lower = np.char.lower(conditions)[condition.codes]
+ptype_lower = np.char.lower(property_types)[pt_idx]
+bed_s = bedrooms.astype(str)
+bath_s = bathrooms.astype(str)
+
+# Format each template only over the rows that drew it
+descriptions = np.empty(n_rows, dtype=object)
+for k, template in enumerate(description_templates):
+    rows = np.flatnonzero(template_idx == k)
+    descriptions[rows] = [
+        template.format(
+            condition=condition_lower[i],
+            property_type=ptype_lower[i],
+            bedrooms=bed_s[i],
+            bathrooms=bath_s[i],
+            city=cities[city_idx[i]]
+        )
+        for i in rows
+    ]
+
+# Add some variation
+descriptions = np.char.add(descriptions.astype(str), np.where(updated_mask, " Updated kitchen and appliances.", ""))
+descriptions = np.char.add(descriptions, np.where(schools_mask, " Close to schools and shopping.", ""))
 
 # 8. Additional numeric features
-year_built = 2024 - age.astype(int)
-stories = np.random.choice([1, 2, 3], n_rows, p=[0.4, 0.5, 0.1])
-garage_spaces = np.random.choice([0, 1, 2, 3], n_rows, p=[0.2, 0.3, 0.4, 0.1])
+year_built = 2024 - age.astype(np.int16)
+stories = np.array([1, 2, 3])[sample_codes([0.4, 0.5, 0.1], n_rows)]
+garage_spaces = np.array([0, 1, 2, 3])[sample_codes([0.2, 0.3, 0.4, 0.1], n_rows)]
 
 # HOA fees (some missing)
-hoa_fee = np.random.gamma(shape=2, scale=100, size=n_rows)
-hoa_fee = np.where(property_type == 'Condo', hoa_fee + 200, hoa_fee)
+hoa_fee = rng.gamma(shape=2, scale=100, size=n_rows)
+hoa_fee = np.where(pt_idx == condo_code, hoa_fee + 200, hoa_fee)
 
-# Days on market
-days_on_market = np.abs(np.random.normal(45, 30, n_rows))
+# Days on market (folded normal(45, 30), scaled in place)
+days_on_market = rng.standard_normal(n_rows)
+np.multiply(days_on_market, 30, out=days_on_market)
+np.add(days_on_market, 45, out=days_on_market)
+np.abs(days_on_market, out=days_on_market)
 
 # Number of views (online listing views)
-views = np.random.poisson(lam=100, size=n_rows) + 20
+views = rng.poisson(lam=100, size=n_rows) + 20
 
 # School rating (1-10)
-school_rating = np.random.choice(range(1, 11), n_rows, p=[0.05, 0.05, 0.1, 0.15, 0.15, 0.15, 0.15, 0.1, 0.05, 0.05])
+school_rating = np.arange(1, 11)[sample_codes([0.05, 0.05, 0.1, 0.15, 0.15, 0.15, 0.15, 0.1, 0.05, 0.05], n_rows)]
 
 # Walk score (0-100)
-walk_score = np.random.beta(a=5, b=2, size=n_rows) * 100
+walk_score = rng.beta(a=5, b=2, size=n_rows) * 100
 
 # ======================================================
 # 9. Introduce Missing Values (realistic patterns)
 # ======================================================
+# One batch of uniforms feeds every random missingness mask below
+mask_u = rng.random((4, n_rows))
+
 # LOT SIZE: Missing for condos (no lot)
-lot_size = np.where(property_type == 'Condo', np.nan, lot_size)
+lot_size = np.where(pt_idx == condo_code, np.nan, lot_size)
 
 # HOA FEE: Missing for some single family homes
-missing_hoa_mask = (property_type == 'Single Family') & (np.random.random(n_rows) > 0.6)
+missing_hoa_mask = (pt_idx == sf_code) & (mask_u[0] < 0.4)
 hoa_fee = np.where(missing_hoa_mask, np.nan, hoa_fee)
 
 # YEAR BUILT: Random missing (5%)
-year_built_mask = np.random.random(n_rows) > 0.95
-year_built = np.where(year_built_mask, np.nan, year_built)
+year_built_mask = mask_u[1] < 0.05
+year_built = pd.array(year_built, dtype='Int16')
+year_built[year_built_mask] = pd.NA
 
 # DESCRIPTION: Some missing (3%)
-description_mask = np.random.random(n_rows) > 0.97
-descriptions = [desc if not description_mask[i] else np.nan for i, desc in enumerate(descriptions)]
+description_mask = mask_u[2] < 0.03
+descriptions = descriptions.astype(object)
+descriptions[description_mask] = np.nan
 
 # WALK SCORE: Random missing (10%)
-walk_score_mask = np.random.random(n_rows) > 0.9
-walk_score = np.where(walk_score_mask, np.nan, walk_score)
+walk_score_mask = mask_u[3] < 0.1
+walk_score[walk_score_mask] = np.nan
 
 # ======================================================
 # 10. Create DataFrame
 # ======================================================
+# Downcast numeric columns to the smallest dtype that holds their range
+bedrooms = bedrooms.astype(np.int8)
+bathrooms = bathrooms.astype(np.float32)
+stories = stories.astype(np.int8)
+garage_spaces = garage_spaces.astype(np.int8)
+school_rating = school_rating.astype(np.int8)
+views = views.astype(np.int16)
+age = age.astype(np.float32)
+area = area.astype(np.float32)
+hoa_fee = hoa_fee.astype(np.float32)
+walk_score = walk_score.astype(np.float32)
+days_on_market = days_on_market.astype(np.float32)
+
+# Round in place so every array below is already final and can be adopted
+# by the DataFrame without another copy
+area.round(0, out=area)
+age.round(0, out=age)
+price.round(0, out=price)
+hoa_fee.round(2, out=hoa_fee)
+days_on_market.round(0, out=days_on_market)
+walk_score.round(1, out=walk_score)
+
 df = pd.DataFrame({
     'property_id': property_ids,
     'listing_date': listing_dates,
@@ -189,37 +252,45 @@ df = pd.DataFrame({
     'property_type': property_type,
     'bedrooms': bedrooms,
     'bathrooms': bathrooms,
-    'area': area.round(0),
+    'area': area,
     'lot_size': lot_size,
     'year_built': year_built,
-    'age': age.round(0),
+    'age': age,
     'condition': condition,
-    'price': price.round(0),
+    'price': price,
     'parking': parking,
     'has_pool': has_pool,
     'has_fireplace': has_fireplace,
     'stories': stories,
     'garage_spaces': garage_spaces,
-    'hoa_fee': hoa_fee.round(2),
-    'days_on_market': days_on_market.round(0),
+    'hoa_fee': hoa_fee,
+    'days_on_market': days_on_market,
     'views': views,
     'school_rating': school_rating,
-    'walk_score': walk_score.round(1),
+    'walk_score': walk_score,
     'description': descriptions
-})
-
-# Add some duplicate rows (2%)
-duplicate_indices = np.random.choice(df.index, size=6, replace=False)
-df_duplicates = df.loc[duplicate_indices].copy()
-df = pd.concat([df, df_duplicates], ignore_index=True)
+}, copy=False)
 
-# Shuffle the dataframe
-df = df.sample(frac=1, random_state=42).reset_index(drop=True)
+# Add some duplicate rows (2%) and shuffle in a single gather
+duplicate_indices = rng.choice(n_rows, size=6, replace=False)
+final_idx = np.concatenate([np.arange(n_rows), duplicate_indices])
+shuffle_perm = rng.permutation(final_idx.size)
+df = df.iloc[final_idx[shuffle_perm]].reset_index(drop=True)
 
 # ======================================================
-# 11. Save to CSV
+# 11. Save to Parquet and CSV
 # ======================================================
-df.to_csv('real_estate_data.csv', index=False)
+table = pa.Table.from_pandas(df, preserve_index=False)
+
+# Columnar Parquet keeps the categorical/downcast dtypes and is far smaller
+pq.write_table(table, 'real_estate_data.parquet', compression='snappy')
+
+# The CSV is still written for data_preprocess.ipynb; PyArrow's multi-threaded
+# C++ writer is much faster than DataFrame.to_csv
+for col in ['listing_date', 'sale_date']:
+    # Keep plain YYYY-MM-DD dates in the output
+    table = table.set_column(table.schema.get_field_index(col), col, table[col].cast(pa.date32()))
+pacsv.write_csv(table, 'real_estate_data.csv')
 
 print("✅ Sample dataset created successfully!")
 print(f"📊 Shape: {df.shape}")
@@ -232,7 +303,7 @@ print(f"  • Price range: ${df['price'].min():,.0f} - ${df['price'].max():,.0f}
 print(f"\n🔍 Missing Values:")
 print(df.isnull().sum()[df.isnull().sum() > 0])
 print(f"\n🔄 Duplicates: {df.duplicated().sum()}")
-print("\n📁 File saved as: real_estate_data.csv")
+print("\n📁 Files saved as: real_estate_data.parquet, real_estate_data.csv")
 
 # Display first few rows
 print("\n👀 First 5 rows:")